@@ -1,7 +1,7 @@
 """Criteo1TB workload implemented in Jax."""
 
 import functools
-from typing import Dict, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from flax import jax_utils
 import jax
@@ -110,6 +110,26 @@ class Criteo1TbDlrmSmallWorkload(BaseCriteo1TbDlrmSmallWorkload):
   def is_output_params(self, param_key: spec.ParameterKey) -> bool:
     return param_key == 'Dense_7'
 
+  def _build_input_queue(
+      self,
+      data_rng: spec.RandomState,
+      split: str,
+      data_dir: str,
+      global_batch_size: int,
+      cache: Optional[bool] = None,
+      repeat_final_dataset: Optional[bool] = None,
+      num_batches: Optional[int] = None) -> Iterator[Dict[str, spec.Tensor]]:
+    it = super()._build_input_queue(
+        data_rng=data_rng,
+        split=split,
+        data_dir=data_dir,
+        global_batch_size=global_batch_size,
+        cache=cache,
+        repeat_final_dataset=repeat_final_dataset,
+        num_batches=num_batches)
+    # Copy the next batches to the devices while the current step runs.
+    return jax_utils.prefetch_to_device(it, 2)
+
   def model_fn(
       self,
       params: spec.ParameterContainer,
@@ -155,9 +175,13 @@ class Criteo1TbDlrmSmallWorkload(BaseCriteo1TbDlrmSmallWorkload):
                   params: spec.ParameterContainer,
                   batch: Dict[str, spec.Tensor]) -> spec.Tensor:
     # We do NOT psum inside of _eval_batch_pmapped, so the returned tensor of
-    # shape (local_device_count,) will all be different values.
-    return np.array(
-        self._eval_batch_pmapped(params, batch).sum(), dtype=np.float64)
+    # shape (local_device_count,) will all be different values. The result is
+    # left on device, it is only copied to host in _sum_batch_losses.
+    return self._eval_batch_pmapped(params, batch)
+
+  def _sum_batch_losses(self, batch_losses: List[spec.Tensor]) -> float:
+    # Accumulate in float64 on host, a single sync for the whole eval loop.
+    return np.sum([np.asarray(loss, dtype=np.float64) for loss in batch_losses])
 
 
 class Criteo1TbDlrmSmallTestWorkload(Criteo1TbDlrmSmallWorkload):
@@ -26,8 +26,12 @@ class DotInteract(nn.Module):
 
   def __init__(self, num_sparse_features):
     super().__init__()
-    self.triu_indices = torch.triu_indices(num_sparse_features + 1,
-                                           num_sparse_features + 1)
+    # Registered as a (non-persistent) buffer so that the indices move with the
+    # model, instead of being copied to the device on every forward pass.
+    self.register_buffer(
+        'triu_indices',
+        torch.triu_indices(num_sparse_features + 1, num_sparse_features + 1),
+        persistent=False)
 
   def forward(self, dense_features, sparse_features):
     combined_values = torch.cat((dense_features.unsqueeze(1), sparse_features),
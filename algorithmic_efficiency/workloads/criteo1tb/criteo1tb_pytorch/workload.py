@@ -1,10 +1,13 @@
 """Criteo1TB workload implemented in PyTorch."""
 
 import contextlib
-from typing import Dict, Iterator, Optional, Tuple
+import queue
+import threading
+from typing import Dict, Iterator, List, Optional, Tuple
 
 import torch
 import torch.distributed as dist
+import torch.nn.functional as F
 from torch.nn.parallel import DistributedDataParallel as DDP
 
 from algorithmic_efficiency import param_utils
@@ -17,6 +20,59 @@ from algorithmic_efficiency.workloads.criteo1tb.workload import \
 USE_PYTORCH_DDP, RANK, DEVICE, N_GPUS = pytorch_setup()
 
 
+def _pinned_batches_in_background(
+    np_iter: Iterator[Dict[str, spec.Tensor]],
+    stop: Optional[threading.Event] = None,
+    max_prefetch: int = 2) -> Iterator[Dict[str, spec.Tensor]]:
+  """Fetch numpy batches and copy them to pinned memory in a worker thread.
+
+  The worker exits once `stop` is set, which happens at the latest when this
+  generator is closed or garbage collected.
+  """
+  if stop is None:
+    stop = threading.Event()
+  batch_queue = queue.Queue(maxsize=max_prefetch)
+  end_of_data = object()
+
+  def _pin(value):
+    return torch.as_tensor(value, dtype=torch.float32).pin_memory()
+
+  def _put(item):
+    # Time out regularly, so that a stopped worker does not block forever on a
+    # full queue that nobody reads from anymore.
+    while not stop.is_set():
+      try:
+        batch_queue.put(item, timeout=0.1)
+        return True
+      except queue.Full:
+        pass
+    return False
+
+  def _worker():
+    try:
+      torch.cuda.set_device(DEVICE)
+      for batch in np_iter:
+        if not _put({k: _pin(v) for k, v in batch.items()}):
+          return
+      _put(end_of_data)
+    except Exception as e:  # pylint: disable=broad-except
+      # Re-raised in the main thread below.
+      _put(e)
+
+  threading.Thread(
+      target=_worker, name='criteo_pinned_batches', daemon=True).start()
+  try:
+    while True:
+      batch = batch_queue.get()
+      if batch is end_of_data:
+        return
+      if isinstance(batch, Exception):
+        raise batch
+      yield batch
+  finally:
+    stop.set()
+
+
 class Criteo1TbDlrmSmallWorkload(BaseCriteo1TbDlrmSmallWorkload):
 
   @property
@@ -25,10 +81,8 @@ class Criteo1TbDlrmSmallWorkload(BaseCriteo1TbDlrmSmallWorkload):
 
   def _per_example_sigmoid_binary_cross_entropy(
       self, logits: spec.Tensor, targets: spec.Tensor) -> spec.Tensor:
-    ls = torch.nn.LogSigmoid()
-    log_p = ls(logits)
-    log_not_p = ls(-logits)
-    per_example_losses = -1.0 * (targets * log_p + (1 - targets) * log_not_p)
+    per_example_losses = F.binary_cross_entropy_with_logits(
+        logits, targets.to(dtype=logits.dtype), reduction='none')
     per_example_losses = per_example_losses.reshape(len(per_example_losses), -1)
     return per_example_losses.sum(1)
 
@@ -93,7 +147,15 @@ class Criteo1TbDlrmSmallWorkload(BaseCriteo1TbDlrmSmallWorkload):
     model.to(DEVICE)
     if N_GPUS > 1:
       if USE_PYTORCH_DDP:
-        model = DDP(model, device_ids=[RANK], output_device=RANK)
+        # The model has no buffers that change during training, so there is
+        # no need to broadcast them on every forward pass. Using the gradients
+        # as views into the all-reduce buckets saves a copy per step.
+        model = DDP(
+            model,
+            device_ids=[RANK],
+            output_device=RANK,
+            broadcast_buffers=False,
+            gradient_as_bucket_view=True)
       else:
         model = torch.nn.DataParallel(model)
     return model, None
@@ -132,6 +194,52 @@ class Criteo1TbDlrmSmallWorkload(BaseCriteo1TbDlrmSmallWorkload):
 
     return logits_batch, None
 
+  def _prefetch_to_device(
+      self, np_iter: Iterator[Dict[str, spec.Tensor]]
+  ) -> Iterator[Dict[str, spec.Tensor]]:
+    """Copy numpy batches to DEVICE, one batch ahead of their use.
+
+    On GPU, batches are staged in pinned host memory by a background thread
+    and copied on a side stream, so that fetching and copying the next batch
+    overlaps with the computation on the current one.
+    """
+
+    def _to_device(value):
+      return torch.as_tensor(value, dtype=torch.float32, device=DEVICE)
+
+    if DEVICE.type != 'cuda':
+      for np_batch in np_iter:
+        yield {k: _to_device(v) for k, v in np_batch.items()}
+      return
+
+    def _copy(value):
+      return value.to(DEVICE, non_blocking=True)
+
+    stream = torch.cuda.Stream()
+    cur_batch = None
+    # Stop the pinning thread (and release np_iter) when this generator is
+    # closed or garbage collected, e.g. when a new input queue is built.
+    stop = threading.Event()
+    try:
+      for pinned_batch in _pinned_batches_in_background(np_iter, stop):
+        with torch.cuda.stream(stream):
+          next_batch = {k: _copy(v) for k, v in pinned_batch.items()}
+
+        if cur_batch is not None:
+          yield cur_batch
+
+        torch.cuda.current_stream().wait_stream(stream)
+        for tensor in next_batch.values():
+          # Tell the caching allocator that these tensors are used on the
+          # default stream, so their memory is not reused by the next copy.
+          tensor.record_stream(torch.cuda.current_stream())
+        cur_batch = next_batch
+
+      if cur_batch is not None:
+        yield cur_batch
+    finally:
+      stop.set()
+
   def _build_input_queue(
       self,
       data_rng: spec.RandomState,
@@ -142,6 +250,9 @@ class Criteo1TbDlrmSmallWorkload(BaseCriteo1TbDlrmSmallWorkload):
       repeat_final_dataset: Optional[bool] = None,
       num_batches: Optional[int] = None) -> Iterator[Dict[str, spec.Tensor]]:
     not_train = split != 'train'
+    # The input pipeline pads the remainder of the eval splits to
+    # global_batch_size, so the per-device batch size is the same for all
+    # batches and does not have to be broadcast.
     per_device_batch_size = int(global_batch_size / N_GPUS)
 
     # Only create and iterate over tf input pipeline in one Python process to
@@ -154,64 +265,47 @@ class Criteo1TbDlrmSmallWorkload(BaseCriteo1TbDlrmSmallWorkload):
           global_batch_size=global_batch_size,
           num_batches=num_batches,
           repeat_final_dataset=repeat_final_dataset)
+      device_iter = self._prefetch_to_device(np_iter)
     weights = None
     while True:
       if RANK == 0:
-        batch = next(np_iter)  # pylint: disable=stop-iteration-return
-        inputs = torch.as_tensor(
-            batch['inputs'], dtype=torch.float32, device=DEVICE)
-        targets = torch.as_tensor(
-            batch['targets'], dtype=torch.float32, device=DEVICE)
+        batch = next(device_iter)  # pylint: disable=stop-iteration-return
+        inputs = batch['inputs']
+        targets = batch['targets']
         if not_train:
           weights = batch.get('weights')
           if weights is None:
             weights = torch.ones((N_GPUS, per_device_batch_size, 1),
                                  dtype=torch.float32,
                                  device=DEVICE)
-          else:
-            weights = torch.as_tensor(
-                weights, dtype=torch.float32, device=DEVICE)
         # Send batch to other devices when using DDP.
         if USE_PYTORCH_DDP:
+          # Pack the batch into a single tensor along the feature dimension and
+          # scatter it, so that every device only receives its own shard.
+          tensor_list = [inputs, targets.view(N_GPUS, -1, 1)]
           if not_train:
-            # During eval, the batch size of the remainder might be different.
-            per_device_batch_size = torch.tensor(
-                len(targets[0]), dtype=torch.int32, device=DEVICE)
-            dist.broadcast(per_device_batch_size, src=0)
-            dist.broadcast(weights, src=0)
-            weights = weights[0]
-          dist.broadcast(inputs, src=0)
-          inputs = inputs[0]
-          dist.broadcast(targets, src=0)
-          targets = targets[0]
+            tensor_list.append(weights.view(N_GPUS, -1, 1))
+          tensor = torch.cat(tensor_list, dim=-1)
+          local_tensor = torch.empty_like(tensor[0])
+          dist.scatter(local_tensor, scatter_list=list(tensor), src=0)
         else:
           inputs = inputs.view(-1, *inputs.shape[2:])
           targets = targets.view(-1, *targets.shape[2:])
           if not_train:
             weights = weights.view(-1, *weights.shape[2:])
       else:
+        # 39 input features, 1 target and (only during eval) 1 weight.
+        num_features = 41 if not_train else 40
+        local_tensor = torch.empty((per_device_batch_size, num_features),
+                                   dtype=torch.float32,
+                                   device=DEVICE)
+        dist.scatter(local_tensor, src=0)
+
+      if USE_PYTORCH_DDP:
+        inputs = local_tensor[:, :39]
+        targets = local_tensor[:, 39:40]
         if not_train:
-          # During eval, the batch size of the remainder might be different.
-          per_device_batch_size = torch.empty((1,),
-                                              dtype=torch.int32,
-                                              device=DEVICE)
-          dist.broadcast(per_device_batch_size, src=0)
-          weights = torch.empty((N_GPUS, per_device_batch_size, 1),
-                                dtype=torch.float32,
-                                device=DEVICE)
-          dist.broadcast(weights, src=0)
-          weights = weights[RANK]
-
-        inputs = torch.empty((N_GPUS, per_device_batch_size, 39),
-                             dtype=torch.float32,
-                             device=DEVICE)
-        dist.broadcast(inputs, src=0)
-        inputs = inputs[RANK]
-        targets = torch.empty((N_GPUS, per_device_batch_size, 1),
-                              dtype=torch.float32,
-                              device=DEVICE)
-        dist.broadcast(targets, src=0)
-        targets = targets[RANK]
+          weights = local_tensor[:, 40:]
 
       if weights is None:
         weights = torch.ones(per_device_batch_size, device=DEVICE)
@@ -240,6 +334,9 @@ class Criteo1TbDlrmSmallWorkload(BaseCriteo1TbDlrmSmallWorkload):
         mask_batch=weights)['summed']
     return summed_loss.to(dtype=torch.float64)
 
+  def _sum_batch_losses(self, batch_losses: List[spec.Tensor]) -> spec.Tensor:
+    return torch.stack(batch_losses).sum()
+
 
 class Criteo1TbDlrmSmallTestWorkload(Criteo1TbDlrmSmallWorkload):
   vocab_size: int = 32 * 128 * 16
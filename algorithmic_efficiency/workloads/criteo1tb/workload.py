@@ -1,8 +1,9 @@
 """Criteo1TB DLRM workload base class."""
 
+import abc
 import math
 import os
-from typing import Dict, Iterator, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 from absl import flags
 import torch.distributed as dist
@@ -126,6 +127,14 @@ class BaseCriteo1TbDlrmSmallWorkload(spec.Workload):
     """Max num steps the baseline algo was given to reach the target."""
     return 10_666
 
+  @abc.abstractmethod
+  def _sum_batch_losses(
+      self, batch_losses: List[spec.Tensor]) -> Union[float, spec.Tensor]:
+    """Sum the per-batch eval losses into a scalar with an .item() method.
+
+    JAX returns a host np.float64, PyTorch a float64 scalar tensor on DEVICE.
+    """
+
   def _eval_model_on_split(self,
                            split: str,
                            num_examples: int,
@@ -148,10 +157,13 @@ class BaseCriteo1TbDlrmSmallWorkload(spec.Workload):
           global_batch_size=global_batch_size,
           num_batches=num_batches,
           repeat_final_dataset=True)
-    loss = 0.0
+    # Collect the per-batch losses without blocking on the device, and only
+    # reduce them once all eval batches have been dispatched.
+    batch_losses = []
     for _ in range(num_batches):
       eval_batch = next(self._eval_iters[split])
-      loss += self._eval_batch(params, eval_batch)
+      batch_losses.append(self._eval_batch(params, eval_batch))
+    loss = self._sum_batch_losses(batch_losses)
     if USE_PYTORCH_DDP:
       dist.all_reduce(loss)
     mean_loss = loss.item() / num_examples
@@ -259,8 +259,8 @@ class ImagenetResNetWorkload(BaseImagenetResNetWorkload):
           eval_metrics[metric_name] = 0.0
         eval_metrics[metric_name] += metric_value
 
-    eval_metrics = jax.tree_map(lambda x: float(x[0] / num_examples),
-                                eval_metrics)
+    eval_metrics = jax.tree_util.tree_map(lambda x: float(x[0] / num_examples),
+                                          eval_metrics)
     return eval_metrics
 
 
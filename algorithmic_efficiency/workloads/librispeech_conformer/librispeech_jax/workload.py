@@ -151,9 +151,12 @@ class LibriSpeechConformerWorkload(workload.BaseLibrispeechWorkload):
             prefetch_factor=10,
             pin_memory=False,
             drop_last=train,
+            # Keep the workers alive when `data_utils.cycle` restarts the
+            # loader, instead of respawning them at every epoch/eval round.
+            persistent_workers=True,
         ))
 
-    for batch in iter(dataloader):
+    def _shard_batch(batch):
       inputs, input_paddings = batch['inputs']
       targets, target_paddings = batch['targets']
 
@@ -162,9 +165,11 @@ class LibriSpeechConformerWorkload(workload.BaseLibrispeechWorkload):
           'targets': (targets.numpy(), target_paddings.numpy()),
       }
 
-      padded_batch = data_utils.shard_and_maybe_pad_np(
-          numpy_batch, padding_value=1.0)
-      yield padded_batch
+      return data_utils.shard_and_maybe_pad_np(numpy_batch, padding_value=1.0)
+
+    it = map(_shard_batch, dataloader)
+    # Place each shard directly on its device, two batches ahead of use.
+    return jax_utils.prefetch_to_device(it, 2)
 
   # Does NOT apply regularization, which is left to the submitter to do in
   # `update_params`.
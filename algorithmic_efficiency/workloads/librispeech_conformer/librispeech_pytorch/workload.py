@@ -175,7 +175,10 @@ class LibriSpeechConformerWorkload(workload.BaseLibrispeechWorkload):
         sampler=sampler,
         num_workers=4,
         pin_memory=True,
-        drop_last=is_train)
+        drop_last=is_train,
+        # Keep the workers alive when `data_utils.cycle` restarts the loader,
+        # instead of respawning them at the start of every epoch/eval round.
+        persistent_workers=True)
 
     dataloader = data_utils.cycle(
         dataloader, custom_sampler=USE_PYTORCH_DDP, use_mixup=False)
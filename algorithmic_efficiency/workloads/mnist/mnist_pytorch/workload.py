@@ -2,6 +2,8 @@
 
 from collections import OrderedDict
 import contextlib
+import itertools
+import math
 from typing import Any, Dict, Iterator, Optional, Tuple
 
 import torch
@@ -54,7 +56,34 @@ class MnistWorkload(BaseMnistWorkload):
       cache: Optional[bool] = None,
       repeat_final_dataset: Optional[bool] = None,
       num_batches: Optional[int] = None) -> Iterator[Dict[str, spec.Tensor]]:
-    del cache
+    it = self._build_device_input_queue(data_rng,
+                                        split,
+                                        data_dir,
+                                        global_batch_size,
+                                        cache,
+                                        repeat_final_dataset,
+                                        num_batches)
+    if split in ['validation', 'test']:
+      # These splits are neither shuffled nor augmented, so every eval sees
+      # the same batches. Keep them on the device after the first pass instead
+      # of copying them again for each eval.
+      if num_batches is None:
+        num_examples = (
+            self.num_validation_examples
+            if split == 'validation' else self.num_test_examples)
+        num_batches = math.ceil(num_examples / global_batch_size)
+      it = itertools.cycle(itertools.islice(it, num_batches))
+    return it
+
+  def _build_device_input_queue(
+      self,
+      data_rng: spec.RandomState,
+      split: str,
+      data_dir: str,
+      global_batch_size: int,
+      cache: Optional[bool] = None,
+      repeat_final_dataset: Optional[bool] = None,
+      num_batches: Optional[int] = None) -> Iterator[Dict[str, spec.Tensor]]:
     if N_GPUS != 0:
       per_device_batch_size = int(global_batch_size / N_GPUS)
     else:
@@ -63,12 +92,14 @@ class MnistWorkload(BaseMnistWorkload):
     # Only create and iterate over tf input pipeline in one Python process to
     # avoid creating too many threads.
     if RANK == 0:
-      np_iter = super()._build_input_queue(data_rng,
-                                           split,
-                                           data_dir,
-                                           global_batch_size,
-                                           num_batches,
-                                           repeat_final_dataset)
+      np_iter = super()._build_input_queue(
+          data_rng=data_rng,
+          split=split,
+          data_dir=data_dir,
+          global_batch_size=global_batch_size,
+          cache=cache,
+          repeat_final_dataset=repeat_final_dataset,
+          num_batches=num_batches)
     while True:
       if RANK == 0:
         batch = next(np_iter)  # pylint: disable=stop-iteration-return
@@ -163,7 +194,7 @@ class MnistWorkload(BaseMnistWorkload):
     if mode == spec.ForwardPassMode.EVAL:
       model.eval()
     contexts = {
-        spec.ForwardPassMode.EVAL: torch.no_grad,
+        spec.ForwardPassMode.EVAL: torch.inference_mode,
         spec.ForwardPassMode.TRAIN: contextlib.nullcontext,
     }
     with contexts[mode]():
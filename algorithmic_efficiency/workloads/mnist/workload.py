@@ -47,7 +47,8 @@ def _build_mnist_dataset(
       lambda x: {
           'inputs': _normalize(x['image'], train_mean, train_stddev),
           'targets': x['label'],
-      })
+      },
+      num_parallel_calls=tf.data.AUTOTUNE)
   is_train = split == 'train'
 
   if cache:
@@ -61,6 +62,9 @@ def _build_mnist_dataset(
   if repeat_final_dataset:
     ds = ds.repeat()
 
+  # Prepare the next batches while the current step runs.
+  ds = ds.prefetch(10)
+
   ds = map(
       functools.partial(
           data_utils.shard_and_maybe_pad_np,
@@ -193,6 +197,7 @@ class BaseMnistWorkload(spec.Workload):
     """Run a full evaluation of the model."""
     del global_step
     data_rng, model_rng = prng.split(rng, 2)
+    num_batches = int(math.ceil(num_examples / global_batch_size))
     if split not in self._eval_iters:
       self._eval_iters[split] = self._build_input_queue(
           data_rng=data_rng,
@@ -200,13 +205,13 @@ class BaseMnistWorkload(spec.Workload):
           data_dir=data_dir,
           global_batch_size=global_batch_size,
           cache=True,
-          repeat_final_dataset=True)
+          repeat_final_dataset=True,
+          num_batches=num_batches)
 
     total_metrics = {
         'accuracy': 0.,
         'loss': 0.,
     }
-    num_batches = int(math.ceil(num_examples / global_batch_size))
     num_devices = max(torch.cuda.device_count(), jax.local_device_count())
     for _ in range(num_batches):
       batch = next(self._eval_iters[split])
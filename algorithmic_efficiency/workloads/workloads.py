@@ -1,7 +1,6 @@
 """ Registry of workload info
 """
 import importlib
-import inspect
 import os
 
 from algorithmic_efficiency import spec
@@ -184,13 +183,8 @@ def import_workload(workload_path: str,
 
   # Import the workload module.
   workload_module = importlib.import_module(workload_path)
-  # Get everything defined in the workload module (including our class).
-  workload_module_members = inspect.getmembers(workload_module)
-  workload_class = None
-  for name, value in workload_module_members:
-    if name == workload_class_name:
-      workload_class = value
-      break
+  # Look up the class directly instead of walking all module members.
+  workload_class = getattr(workload_module, workload_class_name, None)
   if workload_class is None:
     raise ValueError(
         f'Could not find member {workload_class_name} in {workload_path}. '
@@ -60,8 +60,8 @@ def init_optimizer_state(workload: spec.Workload,
   del model_params
   del model_state
   del rng
-  params_zeros_like = jax.tree_map(lambda s: jnp.zeros(s.shape_tuple),
-                                   workload.param_shapes)
+  params_zeros_like = jax.tree_util.tree_map(lambda s: jnp.zeros(s.shape_tuple),
+                                             workload.param_shapes)
   opt_init_fn, opt_update_fn = optimizer(hyperparameters,
                                          workload.num_train_examples)
   optimizer_state = opt_init_fn(params_zeros_like)
@@ -72,7 +72,8 @@ def init_optimizer_state(workload: spec.Workload,
     jax.pmap,
     axis_name='batch',
     in_axes=(None, None, 0, 0, 0, None, 0, 0),
-    static_broadcasted_argnums=(0, 1))
+    static_broadcasted_argnums=(0, 1),
+    donate_argnums=(2, 3, 4))
 def pmapped_train_step(workload,
                        opt_update_fn,
                        model_state,
@@ -26,8 +26,8 @@ def init_optimizer_state(workload: spec.Workload,
   del model_params
   del model_state
   del rng
-  params_zeros_like = jax.tree_map(lambda s: jnp.zeros(s.shape_tuple),
-                                   workload.param_shapes)
+  params_zeros_like = jax.tree_util.tree_map(lambda s: jnp.zeros(s.shape_tuple),
+                                             workload.param_shapes)
   opt_init_fn, opt_update_fn = optax.chain(
       optax.scale_by_adam(
           b1=1.0 - hyperparameters.one_minus_beta_1,
@@ -42,17 +42,16 @@ def init_optimizer_state(workload: spec.Workload,
 @functools.partial(
     jax.pmap,
     axis_name='batch',
-    in_axes=(None, None, 0, 0, None, 0, 0, 0),
-    static_broadcasted_argnums=(0, 1))
+    in_axes=(None, None, 0, 0, 0, 0, 0),
+    static_broadcasted_argnums=(0, 1),
+    donate_argnums=(2, 3, 5))
 def pmapped_update_params(workload: spec.Workload,
                           opt_update_fn,
                           current_param_container: spec.ParameterContainer,
                           model_state: spec.ModelAuxiliaryState,
-                          hyperparameters: spec.Hyperparameters,
                           batch: Dict[str, spec.Tensor],
                           optimizer_state: spec.OptimizerState,
                           rng: spec.RandomState) -> spec.UpdateReturn:
-  del hyperparameters
 
   def loss_fn(params):
     logits_batch, new_model_state = workload.model_fn(
@@ -88,6 +87,7 @@ def update_params(workload: spec.Workload,
                   rng: spec.RandomState) -> spec.UpdateReturn:
   """Return (updated_optimizer_state, updated_params, updated_model_state)."""
   del current_params_types
+  del hyperparameters
   del loss_type
   del eval_results
   del global_step
@@ -99,7 +99,6 @@ def update_params(workload: spec.Workload,
       opt_update_fn,
       current_param_container,
       model_state,
-      hyperparameters,
       batch,
       optimizer_state,
       per_device_rngs)
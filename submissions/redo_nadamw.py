@@ -377,10 +377,11 @@ def update_params(workload: spec.Workload,
     if workload.metrics_logger is not None:
       workload.metrics_logger.append_scalar_metrics(metrics_dict, global_step)
     
+    # Reuse the values copied to host above instead of syncing again.
     logging.info('%d) loss = %0.3f, grad_norm = %0.3f',
                  global_step,
-                 loss.item(),
-                 grad_norm.item())
+                 metrics_dict['loss'],
+                 metrics_dict['grad_norm'])
 
   # Reset neurons with low variance.
   reset_inactive_params(current_param_container, optimizer_state)
@@ -20,7 +20,6 @@ python3 tests/reference_algorithm_tests.py \
     --tuning_search_space=reference_algorithms/target_setting_algorithms/criteo1tb/tuning_search_space.json
 """
 
-import copy
 import functools
 import importlib
 import json
@@ -97,9 +96,9 @@ def _make_fake_image_batch(batch_shape, data_shape, num_classes):
 
 def _pytorch_map(inputs):
   if USE_PYTORCH_DDP:
-    return jax.tree_map(
+    return jax.tree_util.tree_map(
         lambda a: torch.as_tensor(a[RANK], device=PYTORCH_DEVICE), inputs)
-  return jax.tree_map(
+  return jax.tree_util.tree_map(
       lambda a: torch.as_tensor(a, device=PYTORCH_DEVICE).view(-1, a.shape[-1])
       if len(a.shape) == 3 else torch.as_tensor(a, device=PYTORCH_DEVICE).view(
           -1),
@@ -399,7 +398,7 @@ def _test_submission(workload_name,
                      n_gpus):
   logging.info(f'========= Testing {workload_name} in {framework}.')
   FLAGS.framework = framework
-  workload_metadata = copy.deepcopy(submission_runner.WORKLOADS[workload_name])
+  workload_metadata = dict(submission_runner.WORKLOADS[workload_name])
   workload_metadata['workload_path'] = os.path.join(
       submission_runner.BASE_WORKLOADS_DIR,
       workload_metadata['workload_path'] + '_' + framework,
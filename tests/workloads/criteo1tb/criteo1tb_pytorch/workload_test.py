@@ -0,0 +1,95 @@
+"""Tests for criteo1tb/criteo1tb_pytorch/workload.py."""
+
+import itertools
+import threading
+from unittest import mock
+
+from absl.testing import absltest
+import numpy as np
+import torch
+
+from algorithmic_efficiency.workloads.criteo1tb.criteo1tb_pytorch import \
+    workload
+
+
+def _np_batches(num_batches):
+  for i in range(num_batches):
+    yield {
+        'inputs': np.full((2, 3), i, dtype=np.float32),
+        'targets': np.full((2,), i, dtype=np.float32),
+    }
+
+
+def _endless_np_batches():
+  for i in itertools.count():
+    yield {'inputs': np.full((2, 3), i, dtype=np.float32)}
+
+
+def _raising_iter(num_batches):
+  yield from _np_batches(num_batches)
+  raise ValueError('input pipeline failed')
+
+
+class PinnedBatchesInBackgroundTest(absltest.TestCase):
+  """Tests for _pinned_batches_in_background."""
+
+  def setUp(self):
+    super().setUp()
+    # Run on CPU: no device to select and nothing to pin.
+    for patcher in [
+        mock.patch.object(torch.cuda, 'set_device'),
+        mock.patch.object(torch.Tensor, 'pin_memory', lambda self: self),
+    ]:
+      patcher.start()
+      self.addCleanup(patcher.stop)
+
+  def test_batches_in_order(self):
+    batches = list(workload._pinned_batches_in_background(_np_batches(5)))
+    self.assertLen(batches, 5)
+    for i, batch in enumerate(batches):
+      self.assertEqual(set(batch), {'inputs', 'targets'})
+      self.assertEqual(batch['inputs'].dtype, torch.float32)
+      self.assertTrue(torch.equal(batch['inputs'], torch.full((2, 3), i)))
+      self.assertTrue(torch.equal(batch['targets'], torch.full((2,), i)))
+
+  def test_empty_iterator(self):
+    self.assertEmpty(list(workload._pinned_batches_in_background(iter([]))))
+
+  def test_exception_is_forwarded(self):
+    it = workload._pinned_batches_in_background(_raising_iter(2))
+    self.assertLen([next(it), next(it)], 2)
+    with self.assertRaisesRegex(ValueError, 'input pipeline failed'):
+      next(it)
+
+  def test_set_device_error_is_forwarded(self):
+    with mock.patch.object(
+        torch.cuda, 'set_device', side_effect=RuntimeError('no device')):
+      it = workload._pinned_batches_in_background(_np_batches(2))
+      with self.assertRaisesRegex(RuntimeError, 'no device'):
+        next(it)
+
+  def _start_and_get_worker(self, it):
+    threads_before = set(threading.enumerate())
+    next(it)
+    workers = set(threading.enumerate()) - threads_before
+    self.assertLen(workers, 1)
+    return workers.pop()
+
+  def test_close_stops_worker(self):
+    it = workload._pinned_batches_in_background(_endless_np_batches())
+    worker = self._start_and_get_worker(it)
+    it.close()
+    worker.join(timeout=5)
+    self.assertFalse(worker.is_alive())
+
+  def test_stop_event_stops_worker(self):
+    stop = threading.Event()
+    it = workload._pinned_batches_in_background(_endless_np_batches(), stop)
+    worker = self._start_and_get_worker(it)
+    stop.set()
+    worker.join(timeout=5)
+    self.assertFalse(worker.is_alive())
+
+
+if __name__ == '__main__':
+  absltest.main()
@@ -0,0 +1,100 @@
+"""Tests for mnist/mnist_pytorch/workload.py."""
+
+import itertools
+from unittest import mock
+
+from absl.testing import absltest
+import numpy as np
+
+from algorithmic_efficiency.workloads.mnist.mnist_pytorch import workload
+from algorithmic_efficiency.workloads.mnist.workload import BaseMnistWorkload
+
+
+def _counting_batches(*args, **kwargs):
+  del args
+  del kwargs
+  for i in itertools.count():
+    yield {'index': i}
+
+
+def _np_batches(*args, **kwargs):
+  del args
+  del kwargs
+  while True:
+    yield {
+        'inputs': np.zeros((1, 2, 28, 28, 1), dtype=np.float32),
+        'targets': np.zeros((1, 2), dtype=np.int64),
+    }
+
+
+class BuildInputQueueTest(absltest.TestCase):
+  """Tests for MnistWorkload._build_input_queue."""
+
+  def setUp(self):
+    super().setUp()
+    self.workload = workload.MnistWorkload()
+    patcher = mock.patch.object(
+        workload.MnistWorkload,
+        '_build_device_input_queue',
+        side_effect=_counting_batches)
+    self.device_queue = patcher.start()
+    self.addCleanup(patcher.stop)
+
+  def _eval_indices(self, num_batches, global_batch_size=1000, num_steps=10):
+    it = self.workload._build_input_queue(
+        data_rng=None,
+        split='validation',
+        data_dir=None,
+        global_batch_size=global_batch_size,
+        num_batches=num_batches)
+    return [batch['index'] for batch in itertools.islice(it, num_steps)]
+
+  def test_eval_queue_cycles_num_batches(self):
+    self.assertEqual(self._eval_indices(num_batches=3), [0, 1, 2] * 3 + [0])
+    self.assertEqual(self.device_queue.call_args.args[-1], 3)
+
+  def test_eval_queue_defaults_to_split_size(self):
+    # 10000 validation examples at batch size 4000.
+    self.assertEqual(
+        self._eval_indices(num_batches=None, global_batch_size=4000),
+        [0, 1, 2] * 3 + [0])
+
+  def test_train_queue_is_not_cycled(self):
+    it = self.workload._build_input_queue(
+        data_rng=None, split='train', data_dir=None, global_batch_size=1000)
+    self.assertEqual([batch['index'] for batch in itertools.islice(it, 5)],
+                     list(range(5)))
+
+
+class BuildDeviceInputQueueTest(absltest.TestCase):
+  """Tests for MnistWorkload._build_device_input_queue."""
+
+  def test_arguments_are_forwarded(self):
+    with mock.patch.object(
+        BaseMnistWorkload, '_build_input_queue',
+        side_effect=_np_batches) as base_queue:
+      it = workload.MnistWorkload()._build_device_input_queue(
+          data_rng=None,
+          split='validation',
+          data_dir=None,
+          global_batch_size=2,
+          cache=True,
+          repeat_final_dataset=True,
+          num_batches=5)
+      batch = next(it)
+    self.assertEqual(
+        base_queue.call_args.kwargs,
+        {
+            'data_rng': None,
+            'split': 'validation',
+            'data_dir': None,
+            'global_batch_size': 2,
+            'cache': True,
+            'repeat_final_dataset': True,
+            'num_batches': 5,
+        })
+    self.assertEqual(tuple(batch['inputs'].shape), (2, 1, 28, 28))
+
+
+if __name__ == '__main__':
+  absltest.main()